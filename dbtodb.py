@@ -2,20 +2,31 @@
 Database to Database Loader using SQL*Loader
 - Extracts data from source Oracle database
 - Exports to CSV with headers
-- Loads into destination Oracle database using SQL*Loader
+- Loads into destination Oracle database using SQL*Loader (or an external table)
 """
 
 import os
+import re
 import sys
 import csv
+import decimal
+import errno
 import tempfile
 import shutil
 import subprocess
 import time
+import threading
 from datetime import datetime
-from multiprocessing import Pool
+from operator import itemgetter
+from multiprocessing import get_context
+from concurrent.futures import ThreadPoolExecutor
 import oracledb
-import gc
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
 
 # =============================================================================
 # SOURCE DATABASE CONFIGURATION
@@ -41,10 +52,42 @@ DEST_SID = "placeholder"
 # PERFORMANCE SETTINGS
 # =============================================================================
 FETCH_BATCH_SIZE = 50000      # Rows to fetch at a time from source
-PARALLEL_CHUNKS = 16          # Split CSV into this many chunks
+DEFAULT_ARRAYSIZE = 10000     # Driver default fetch size for helper/metadata cursors
+POOL_MAX_SESSIONS = 8         # Max pooled sessions per database per process
+PARALLEL_CHUNKS = 6           # Concurrent sqlldr loaders (throughput peaks around 6-7 on an 8-CPU DB server)
+SPLIT_CHUNKS = 12             # Split CSV into this many chunks (loaded PARALLEL_CHUNKS at a time)
+PARALLEL_EXTRACTS = 6         # Parallel source streams per table (1 = single cursor; + split_csv without pipes)
+STREAM_TO_SQLLDR = True       # Pipe extract streams straight into sqlldr via named pipes (Unix only)
 SQLLDR_ROWS = 100000          # SQL*Loader commit interval
+COPY_BUFFER_SIZE = 4*1024*1024  # Read size when splitting CSVs without os.sendfile
+PROGRESS_INTERVAL = 5         # Seconds between extract progress lines
+WRITE_BUFFER_SIZE = 64*1024*1024  # Output buffer for CSV files/pipes (fewer, larger write() calls)
 DIRECT_PATH = True            # Use direct path loading (faster)
 USE_STAGING_TABLES = True     # Use staging tables for lock-free parallel loading
+NOLOGGING_LOAD = True         # Set the destination NOLOGGING while loading (minimal redo; take a backup after!)
+INDEX_REBUILD_WORKERS = 4     # Indexes rebuilt concurrently (each on its own connection)
+INDEX_REBUILD_PARALLEL = 4    # PARALLEL degree for each index rebuild
+DIRECT_INSERT_MAX_ROWS = 5000000  # Smaller tables skip CSV/sqlldr and use executemany (0 = off)
+INSERT_BATCH_SIZE = 10000     # Rows per executemany call for small tables
+USE_ARROW_FETCH = True        # Fetch fallback extracts as Arrow data frames when pyarrow is installed
+MAX_SQL_LINE_BYTES = 4000     # VARCHAR2 limit for server-built CSV lines (32767 if MAX_STRING_SIZE=EXTENDED)
+SDU_SIZE = 2097152            # Session data unit requested per connection (the server caps it at its own DEFAULT_SDU_SIZE)
+
+# External table loading (instead of SQL*Loader). Set both to enable: chunk
+# CSVs are written to EXTERNAL_TABLE_PATH, which must be the path of Oracle
+# DIRECTORY object EXTERNAL_TABLE_DIRECTORY as seen by the destination server
+EXTERNAL_TABLE_DIRECTORY = None   # e.g. "DATA_TRANSFER_DIR"
+EXTERNAL_TABLE_PATH = None        # e.g. "/shared/data_transfer"
+
+# Column types that can be rendered to CSV text inside the source database
+CSV_NUMERIC_TYPES = {'NUMBER', 'FLOAT', 'INTEGER', 'BINARY_FLOAT', 'BINARY_DOUBLE'}
+# No NVARCHAR2/NCHAR: concatenating one makes the whole line NVARCHAR2, whose
+# limit (2000 chars in AL16UTF16) is below MAX_SQL_LINE_BYTES - those tables
+# use the csv.writer/Arrow path
+CSV_CHAR_TYPES = {'VARCHAR2', 'CHAR', 'VARCHAR'}
+
+# Column types the Arrow fetch writes as valid CSV (see arrow_csv_type)
+ARROW_CSV_TYPES = {'VARCHAR2', 'NVARCHAR2', 'CHAR', 'NCHAR', 'DATE', 'BINARY_FLOAT', 'BINARY_DOUBLE'}
 
 # =============================================================================
 # TABLES TO TRANSFER (add your tables here)
@@ -58,10 +101,13 @@ TABLES_TO_TRANSFER = [
 # =============================================================================
 # CONNECTION SETUP
 # =============================================================================
-source_dsn = oracledb.makedsn(SOURCE_HOST, SOURCE_PORT, sid=SOURCE_SID)
+# Large SDU so big fetch/bind round trips go out in fewer network packets
+sdu_descriptor = f"(DESCRIPTION=(SDU={SDU_SIZE})"
+
+source_dsn = oracledb.makedsn(SOURCE_HOST, SOURCE_PORT, sid=SOURCE_SID).replace("(DESCRIPTION=", sdu_descriptor, 1)
 source_connection_string = f"{SOURCE_USER}/{SOURCE_PASSWORD}@{source_dsn}"
 
-dest_dsn = oracledb.makedsn(DEST_HOST, DEST_PORT, sid=DEST_SID)
+dest_dsn = oracledb.makedsn(DEST_HOST, DEST_PORT, sid=DEST_SID).replace("(DESCRIPTION=", sdu_descriptor, 1)
 dest_connection_string = f"{DEST_USER}/{DEST_PASSWORD}@{dest_dsn}"
 
 # SQL*Loader connection string
@@ -74,50 +120,139 @@ def init_oracle_client():
         oracledb.init_oracle_client()
     except Exception as e:
         print(f"Oracle client init: {e}")
+    
+    # Fetch in big round trips by default. Each cursor reserves
+    # arraysize x row width of client memory, so keep this moderate.
+    oracledb.defaults.arraysize = DEFAULT_ARRAYSIZE
+    oracledb.defaults.prefetchrows = DEFAULT_ARRAYSIZE
+
+
+# Connection pools per (connection string, process) - worker processes
+# never reuse the parent's sessions, so each process builds its own
+connection_pools = {}
+
+
+def get_pooled_connection(connection_string):
+    """Acquire a connection from this process's pool (close() releases it)"""
+    key = (connection_string, os.getpid())
+    pool = connection_pools.get(key)
+    if pool is None:
+        pool = oracledb.create_pool(connection_string, min=1, max=POOL_MAX_SESSIONS, increment=1)
+        connection_pools[key] = pool
+    return pool.acquire()
 
 
 def get_source_connection():
     """Get connection to source database"""
-    return oracledb.connect(source_connection_string)
+    return get_pooled_connection(source_connection_string)
 
 
 def get_dest_connection():
     """Get connection to destination database"""
-    return oracledb.connect(dest_connection_string)
+    return get_pooled_connection(dest_connection_string)
+
+
+# Column metadata per (table, schema) - looked up once per run
+table_columns_cache = {}
+
+# Driver type -> data dictionary type name (as used in DATA_TYPE checks)
+DB_TYPE_NAMES = {
+    oracledb.DB_TYPE_VARCHAR: 'VARCHAR2',
+    oracledb.DB_TYPE_NVARCHAR: 'NVARCHAR2',
+    oracledb.DB_TYPE_CHAR: 'CHAR',
+    oracledb.DB_TYPE_NCHAR: 'NCHAR',
+    oracledb.DB_TYPE_NUMBER: 'NUMBER',
+    oracledb.DB_TYPE_BINARY_FLOAT: 'BINARY_FLOAT',
+    oracledb.DB_TYPE_BINARY_DOUBLE: 'BINARY_DOUBLE',
+    oracledb.DB_TYPE_DATE: 'DATE',
+    oracledb.DB_TYPE_TIMESTAMP: 'TIMESTAMP',
+    oracledb.DB_TYPE_TIMESTAMP_TZ: 'TIMESTAMP WITH TIME ZONE',
+    oracledb.DB_TYPE_TIMESTAMP_LTZ: 'TIMESTAMP WITH LOCAL TIME ZONE',
+    oracledb.DB_TYPE_RAW: 'RAW',
+    oracledb.DB_TYPE_LONG: 'LONG',
+    oracledb.DB_TYPE_LONG_RAW: 'LONG RAW',
+    oracledb.DB_TYPE_CLOB: 'CLOB',
+    oracledb.DB_TYPE_NCLOB: 'NCLOB',
+    oracledb.DB_TYPE_BLOB: 'BLOB',
+}
+
+# Types bound by max size in setinputsizes rather than by type
+# (N-types stay typed so they are not bound in the database character set)
+STRING_DB_TYPES = (oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_CHAR)
 
 
 def get_table_columns(table_name, connection_string, schema):
-    """Get column names and types from a table"""
+    """Get column names and types from a table (cached after the first lookup).
+    
+    Describes an empty SELECT * and reads cursor.description instead of
+    querying ALL_TAB_COLUMNS; this also leaves out invisible columns.
+    Returns (name, type, data_length, precision, scale) tuples.
+    """
+    cache_key = (table_name.upper(), schema.upper())
+    if cache_key in table_columns_cache:
+        return table_columns_cache[cache_key]
+    
     try:
-        connection = oracledb.connect(connection_string)
+        connection = get_pooled_connection(connection_string)
         cursor = connection.cursor()
-        cursor.execute("""
-            SELECT column_name, data_type, data_length, data_precision, data_scale
-            FROM all_tab_columns 
-            WHERE table_name = :1 AND owner = :2
-            ORDER BY column_id
-        """, [table_name.upper(), schema.upper()])
-        columns = cursor.fetchall()
+        cursor.execute(f"SELECT * FROM {schema}.{table_name} WHERE 1=0")
+        columns = [
+            (name, DB_TYPE_NAMES.get(type_code, type_code.name.replace('DB_TYPE_', '')),
+             internal_size, precision, scale)
+            for name, type_code, _, internal_size, precision, scale, _ in cursor.description
+        ]
         cursor.close()
         connection.close()
+        if columns:
+            table_columns_cache[cache_key] = columns
         return columns
     except Exception as e:
         print(f"  Error getting columns: {e}")
         return []
 
 
-def get_row_count(table_name, connection):
-    """Get approximate row count from table"""
+def get_row_count(table_name, connection, schema=SOURCE_SCHEMA):
+    """Get approximate row count from table.
+    
+    Uses the optimizer statistics (NUM_ROWS) - instant, and only falls back
+    to a full COUNT(*) when the table has never been analyzed.
+    """
     try:
         cursor = connection.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
+        cursor.execute("""
+            SELECT num_rows FROM all_tables
+            WHERE owner = :1 AND table_name = :2
+        """, [schema.upper(), table_name.upper()])
+        row = cursor.fetchone()
+        count = row[0] if row else None
+        
+        if count is None:
+            cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table_name}")
+            count = cursor.fetchone()[0]
+        
         cursor.close()
         return count
     except:
         return 0
 
 
+def count_rows_upto(table_name, connection, limit, schema=SOURCE_SCHEMA):
+    """Exact row count, but stop counting at limit (reads at most limit rows)"""
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM {schema}.{table_name} WHERE ROWNUM <= :1
+            )
+        """, [limit])
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count
+    except Exception as e:
+        print(f"  Error counting rows: {e}")
+        return limit
+
+
 def format_elapsed(seconds):
     """Format elapsed time"""
     if seconds < 60:
@@ -131,76 +266,229 @@ def format_elapsed(seconds):
 # =============================================================================
 # STEP 1: EXTRACT DATA FROM SOURCE
 # =============================================================================
-def extract_to_csv(table_name, output_dir):
+def build_csv_line_sql(columns):
+    """Build a SQL expression that renders a whole row as one CSV line.
+
+    Returns None if a column type can't be rendered in SQL or the line could
+    exceed MAX_SQL_LINE_BYTES - the caller then falls back to csv.writer.
+    """
+    parts = []
+    max_width = 0
+    for col_name, col_type, data_length, _, _ in columns:
+        if 'TIMESTAMP' in col_type:
+            parts.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS.FF6')")
+            max_width += 26
+        elif col_type == 'DATE':
+            parts.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS')")
+            max_width += 19
+        elif col_type in CSV_NUMERIC_TYPES:
+            parts.append(f"TO_CHAR({col_name}, 'TM9', 'NLS_NUMERIC_CHARACTERS=''.,''')")
+            max_width += 64
+        elif col_type in CSV_CHAR_TYPES:
+            # Quote text and double embedded quotes; NULL stays empty
+            parts.append(f"""NVL2({col_name}, '"' || REPLACE({col_name}, '"', '""') || '"', NULL)""")
+            max_width += 2 * data_length + 2
+        else:
+            return None
+        max_width += 1  # Delimiter or newline
+    
+    if max_width > MAX_SQL_LINE_BYTES:
+        return None
+    
+    # Trailing newline also keeps all-NULL rows from coming back as NULL
+    return " || ',' || ".join(parts) + " || CHR(10)"
+
+
+def build_extract_sql(table_name, columns):
+    """Build the extract SELECT - returns (select_sql, extract_mode).
+    
+    extract_mode is 'lines' (server-built CSV lines), 'arrow' (fetched as
+    Arrow batches and written by pyarrow) or 'rows' (csv.writer).
+    """
+    # Let the database build each CSV line when the row fits in a VARCHAR2
+    line_sql = build_csv_line_sql(columns)
+    if line_sql:
+        return f"SELECT {line_sql} FROM {SOURCE_SCHEMA}.{table_name}", 'lines'
+    
+    # Build SELECT with proper date formatting
+    select_cols = []
+    for col_name, col_type, _, _, _ in columns:
+        if 'TIMESTAMP' in col_type:
+            select_cols.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS.FF6') AS {col_name}")
+        elif col_type == 'DATE':
+            select_cols.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS') AS {col_name}")
+        else:
+            select_cols.append(col_name)
+    
+    extract_mode = 'arrow' if use_arrow_fetch(columns) else 'rows'
+    return f"SELECT {', '.join(select_cols)} FROM {SOURCE_SCHEMA}.{table_name}", extract_mode
+
+
+def iter_batches(cursor, label, row_count_est, batch_size=FETCH_BATCH_SIZE):
+    """Yield fetchmany() batches from an executed cursor, reporting progress"""
+    return track_progress(iter(lambda: cursor.fetchmany(batch_size), []), label, row_count_est)
+
+
+def track_progress(batches, label, row_count_est):
+    """Pass batches (anything with len()) through, reporting progress.
+    
+    Consumers get whole batches to hand to C-level writers (writerows, join,
+    executemany); progress is printed every PROGRESS_INTERVAL seconds by a
+    background thread, so the fetch loop itself does no bookkeeping.
+    """
+    row_count = 0
+    start_time = datetime.now()
+    done = threading.Event()
+    
+    def report_progress():
+        while not done.wait(PROGRESS_INTERVAL):
+            elapsed = (datetime.now() - start_time).total_seconds()
+            speed = row_count / elapsed if elapsed > 0 else 0
+            pct = (row_count / row_count_est * 100) if row_count_est > 0 else 0
+            print(f"{label} {row_count:,} rows ({pct:.1f}%) - {speed:,.0f} rows/s")
+    
+    threading.Thread(target=report_progress, daemon=True).start()
+    
+    try:
+        for batch in batches:
+            yield batch
+            row_count += len(batch)
+    finally:
+        done.set()
+
+
+def arrow_csv_type(column):
+    """Whether a column of the fallback query comes out of Arrow CSV-ready.
+    
+    Text, and dates (TO_CHAR'd in the query), are written as is; NUMBER only
+    when it's integral and fits int64 (otherwise data frames fetch it as a
+    double and lose digits). RAW/LOB/INTERVAL/ROWID etc. keep csv.writer.
+    """
+    _, col_type, _, precision, scale = column
+    if col_type in ARROW_CSV_TYPES or 'TIMESTAMP' in col_type:
+        return True
+    return col_type == 'NUMBER' and scale == 0 and 0 < (precision or 0) <= 18
+
+
+def use_arrow_fetch(columns):
+    """Whether python-oracledb data frames + pyarrow can write this extract"""
+    return (USE_ARROW_FETCH and pyarrow is not None
+            and hasattr(oracledb.Connection, 'fetch_df_batches')
+            and all(arrow_csv_type(col) for col in columns))
+
+
+def write_csv_arrow(connection, sql, params, f, label, row_count_est):
+    """Fetch as Arrow record batches and let pyarrow write the CSV.
+    
+    Skips building a Python tuple per row; only used for the fallback
+    (non server-side) query, whose dates are already TO_CHAR'd.
+    """
+    # Arrow writes bytes - push any pending text (header) out first
+    f.flush()
+    
+    options = pyarrow.csv.WriteOptions(include_header=False)
+    writer = None
+    row_count = 0
+    
+    frames = connection.fetch_df_batches(sql, parameters=params, size=FETCH_BATCH_SIZE)
+    for table in track_progress(map(pyarrow.table, frames), label, row_count_est):
+        if writer is None:
+            writer = pyarrow.csv.CSVWriter(f.buffer, table.schema, write_options=options)
+        writer.write_table(table)
+        row_count += table.num_rows
+    
+    if writer is not None:
+        writer.close()
+    f.buffer.flush()
+    return row_count
+
+
+def write_csv_rows(connection, sql, params, f, extract_mode, label, row_count_est):
+    """Run the extract query and write all rows to f as CSV"""
+    if extract_mode == 'arrow':
+        return write_csv_arrow(connection, sql, params, f, label, row_count_est)
+    
+    cursor = open_extract_cursor(connection)
+    cursor.execute(sql, params)
+    
+    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+    first_col = itemgetter(0)
+    
+    row_count = 0
+    
+    for rows in iter_batches(cursor, label, row_count_est):
+        if extract_mode == 'lines':
+            # One write per batch - lines already carry their newline
+            f.write(''.join(map(first_col, rows)))
+        else:
+            # csv.writer already writes None as an empty field
+            writer.writerows(rows)
+        
+        row_count += len(rows)
+    
+    cursor.close()
+    return row_count
+
+
+def open_extract_cursor(connection):
+    """Open a cursor tuned for streaming a large result set"""
+    cursor = connection.cursor()
+    # prefetchrows must be set BEFORE execute so the first round trip
+    # already returns a full batch (+1 avoids an extra round trip just to
+    # detect the end of small tables)
+    cursor.arraysize = FETCH_BATCH_SIZE
+    cursor.prefetchrows = FETCH_BATCH_SIZE + 1
+    return cursor
+
+
+def prepare_extract(table_name, row_count_est):
+    """Look up columns and build the extract query.
+    
+    Returns (columns, select_sql, extract_mode), or None if the table has no
+    columns.
+    """
+    columns = get_table_columns(table_name, source_connection_string, SOURCE_SCHEMA)
+    if not columns:
+        print(f"    ERROR: No columns found for {table_name}")
+        return None
+    
+    print(f"    Columns: {len(columns)}")
+    print(f"    Estimated rows: {row_count_est:,}")
+    
+    select_sql, extract_mode = build_extract_sql(table_name, columns)
+    if extract_mode == 'lines':
+        print("    Mode: server-side CSV lines")
+    elif extract_mode == 'arrow':
+        print("    Mode: Arrow batches (row too wide for server-side lines)")
+    else:
+        print("    Mode: Python csv.writer (row too wide or unsupported types)")
+    
+    return columns, select_sql, extract_mode
+
+
+def extract_to_csv(table_name, output_dir, row_count_est):
     """Extract table data from source database to CSV"""
     print(f"\n  Extracting {table_name} from source...")
     
     csv_file = os.path.join(output_dir, f"{table_name}.csv")
     
     try:
-        connection = get_source_connection()
-        cursor = connection.cursor()
-        
-        # Get columns
-        columns = get_table_columns(table_name, source_connection_string, SOURCE_SCHEMA)
-        if not columns:
-            print(f"    ERROR: No columns found for {table_name}")
+        prepared = prepare_extract(table_name, row_count_est)
+        if not prepared:
             return None, 0, []
-        
+        columns, select_sql, extract_mode = prepared
         column_names = [col[0] for col in columns]
-        column_types = {col[0]: col[1] for col in columns}
-        
-        print(f"    Columns: {len(column_names)}")
-        
-        # Get row count
-        row_count_est = get_row_count(table_name, connection)
-        print(f"    Estimated rows: {row_count_est:,}")
-        
-        # Build SELECT with proper date formatting
-        select_cols = []
-        for col_name in column_names:
-            col_type = column_types.get(col_name, '')
-            if 'TIMESTAMP' in col_type:
-                select_cols.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS.FF6') AS {col_name}")
-            elif col_type == 'DATE':
-                select_cols.append(f"TO_CHAR({col_name}, 'YYYY-MM-DD HH24:MI:SS') AS {col_name}")
-            else:
-                select_cols.append(col_name)
-        
-        select_sql = f"SELECT {', '.join(select_cols)} FROM {SOURCE_SCHEMA}.{table_name}"
         
         # Execute and fetch
-        cursor.arraysize = FETCH_BATCH_SIZE
-        cursor.execute(select_sql)
-        
-        row_count = 0
+        connection = get_source_connection()
         start_time = datetime.now()
         
-        with open(csv_file, 'w', encoding='utf-8', newline='', buffering=16*1024*1024) as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-            
+        with open(csv_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
             # Write header
-            writer.writerow(column_names)
-            
-            # Fetch and write in batches
-            while True:
-                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
-                if not rows:
-                    break
-                
-                for row in rows:
-                    # Convert None to empty string
-                    writer.writerow(['' if v is None else v for v in row])
-                
-                row_count += len(rows)
-                
-                if row_count % 500000 == 0:
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    speed = row_count / elapsed if elapsed > 0 else 0
-                    pct = (row_count / row_count_est * 100) if row_count_est > 0 else 0
-                    print(f"    Extracted {row_count:,} rows ({pct:.1f}%) - {speed:,.0f} rows/s")
+            f.write(','.join(column_names) + '\n')
+            row_count = write_csv_rows(connection, select_sql, [], f, extract_mode,
+                                       "    Extracted", row_count_est)
         
-        cursor.close()
         connection.close()
         
         elapsed = (datetime.now() - start_time).total_seconds()
@@ -219,6 +507,97 @@ def extract_to_csv(table_name, output_dir):
         return None, 0, []
 
 
+def extract_slice(select_sql, extract_mode, f, chunk_id, num_chunks, row_count_est):
+    """Write one ORA_HASH(ROWID) slice of the extract query to an open file"""
+    if num_chunks > 1:
+        sql, params = f"{select_sql} WHERE ORA_HASH(ROWID, :1) = :2", [num_chunks - 1, chunk_id]
+    else:
+        sql, params = select_sql, []
+    
+    connection = get_source_connection()
+    row_count = write_csv_rows(connection, sql, params, f, extract_mode,
+                               f"      [Extract {chunk_id:02d}] Extracted",
+                               row_count_est // num_chunks)
+    
+    connection.close()
+    return row_count
+
+
+def extract_chunk(args):
+    """Extract one ORA_HASH(ROWID) slice of a table to a headerless chunk CSV"""
+    select_sql, extract_mode, chunk_file, chunk_id, num_chunks, row_count_est = args
+    
+    start_time = datetime.now()
+    
+    try:
+        with open(chunk_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            row_count = extract_slice(select_sql, extract_mode, f, chunk_id, num_chunks, row_count_est)
+        
+        elapsed = (datetime.now() - start_time).total_seconds()
+        speed = row_count / elapsed if elapsed > 0 else 0
+        print(f"      [Extract {chunk_id:02d}] {row_count:,} rows in {elapsed:.1f}s ({speed:,.0f}/s)")
+        
+        return True, row_count
+        
+    except Exception as e:
+        print(f"      [Extract {chunk_id:02d}] ERROR: {e}")
+        return False, 0
+
+
+def use_named_pipes():
+    """Whether chunks are streamed to SQL*Loader through named pipes"""
+    return STREAM_TO_SQLLDR and hasattr(os, 'mkfifo') and not use_external_table()
+
+
+def use_external_table():
+    """Whether chunks are loaded through an external table instead of sqlldr"""
+    return bool(EXTERNAL_TABLE_DIRECTORY and EXTERNAL_TABLE_PATH)
+
+
+def prepare_chunks(table_name, num_chunks, output_dir, row_count_est):
+    """Plan a parallel extract of num_chunks ROWID-hash slices.
+    
+    Nothing is extracted yet - each load worker extracts its own slice and
+    loads it straight away, so extract and load overlap. Slices go through
+    named pipes when supported, otherwise through chunk CSVs. Every slice
+    scans the whole table and keeps only its own rows, so keep num_chunks
+    small (see PARALLEL_EXTRACTS).
+    
+    Returns (chunk_files, extract_args, columns).
+    """
+    pipes = use_named_pipes()
+    print(f"\n  Preparing {table_name} for parallel extract "
+          f"({num_chunks} {'named pipes' if pipes else 'chunk files'})...")
+    
+    try:
+        prepared = prepare_extract(table_name, row_count_est)
+        if not prepared:
+            return None, None, []
+        columns, select_sql, extract_mode = prepared
+        
+        chunk_files = []
+        for i in range(num_chunks):
+            if pipes:
+                chunk_path = os.path.join(output_dir, f"{table_name}_chunk{i:02d}.pipe")
+                os.mkfifo(chunk_path)
+            else:
+                chunk_path = os.path.join(output_dir, f"{table_name}_chunk{i:02d}.csv")
+            chunk_files.append(chunk_path)
+        
+        extract_args = [
+            (select_sql, extract_mode, chunk_files[i], i, num_chunks, row_count_est)
+            for i in range(num_chunks)
+        ]
+        
+        return chunk_files, extract_args, columns
+        
+    except Exception as e:
+        print(f"    ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return None, None, []
+
+
 # =============================================================================
 # STEP 2: PREPARE DESTINATION
 # =============================================================================
@@ -237,72 +616,185 @@ def truncate_dest_table(table_name):
         return False
 
 
-def get_table_indexes(table_name):
-    """Get indexes on destination table"""
+# Truncate (optional) and mark every index unusable in one round trip.
+# Returns the disabled indexes and any per-index errors as ref cursors.
+DISABLE_INDEXES_PLSQL = """
+    DECLARE
+        disabled SYS.ODCIVARCHAR2LIST := SYS.ODCIVARCHAR2LIST();
+        failed   SYS.ODCIVARCHAR2LIST := SYS.ODCIVARCHAR2LIST();
+    BEGIN
+        IF :do_truncate = 1 THEN
+            BEGIN
+                EXECUTE IMMEDIATE 'TRUNCATE TABLE ' || :owner || '.' || :table_name;
+            EXCEPTION WHEN OTHERS THEN
+                failed.EXTEND;
+                failed(failed.COUNT) := 'TRUNCATE: ' || SQLERRM;
+            END;
+        END IF;
+        
+        FOR r IN (SELECT index_name FROM all_indexes
+                  WHERE table_name = :table_name AND owner = :owner
+                  AND index_type != 'LOB') LOOP
+            BEGIN
+                EXECUTE IMMEDIATE 'ALTER INDEX ' || :owner || '.' || r.index_name || ' UNUSABLE';
+                disabled.EXTEND;
+                disabled(disabled.COUNT) := r.index_name;
+            EXCEPTION WHEN OTHERS THEN
+                failed.EXTEND;
+                failed(failed.COUNT) := r.index_name || ': ' || SQLERRM;
+            END;
+        END LOOP;
+        
+        OPEN :disabled_out FOR
+            SELECT index_name, uniqueness, logging FROM all_indexes
+            WHERE owner = :owner
+            AND index_name IN (SELECT column_value FROM TABLE(disabled));
+        OPEN :failed_out FOR SELECT column_value FROM TABLE(failed);
+    END;
+"""
+
+# Reset rebuilt indexes to NOPARALLEL and their original LOGGING/NOLOGGING
+# in one round trip; returns per-index errors
+RESET_INDEXES_PLSQL = """
+    DECLARE
+        names  SYS.ODCIVARCHAR2LIST := :index_names;
+        modes  SYS.ODCIVARCHAR2LIST := :index_modes;
+        failed SYS.ODCIVARCHAR2LIST := SYS.ODCIVARCHAR2LIST();
+    BEGIN
+        FOR i IN 1 .. names.COUNT LOOP
+            BEGIN
+                EXECUTE IMMEDIATE 'ALTER INDEX ' || :owner || '.' || names(i) || ' NOPARALLEL ' || modes(i);
+            EXCEPTION WHEN OTHERS THEN
+                failed.EXTEND;
+                failed(failed.COUNT) := names(i) || ': ' || SQLERRM;
+            END;
+        END LOOP;
+        
+        OPEN :failed_out FOR SELECT column_value FROM TABLE(failed);
+    END;
+"""
+
+
+def get_table_logging(table_name):
+    """Get the LOGGING attribute of a destination table ('YES', 'NO' or None)"""
     try:
         connection = get_dest_connection()
         cursor = connection.cursor()
         cursor.execute("""
-            SELECT index_name, uniqueness 
-            FROM all_indexes 
+            SELECT logging FROM all_tables
             WHERE table_name = :1 AND owner = :2
-            AND index_type != 'LOB'
         """, [table_name.upper(), DEST_SCHEMA.upper()])
-        indexes = cursor.fetchall()
+        row = cursor.fetchone()
         cursor.close()
         connection.close()
-        return indexes
+        return row[0] if row else None
     except Exception as e:
-        print(f"    Error getting indexes: {e}")
-        return []
+        print(f"    Error checking logging: {e}")
+        return None
 
 
-def disable_indexes(table_name):
-    """Disable indexes for faster loading"""
-    indexes = get_table_indexes(table_name)
-    if not indexes:
-        return []
+def set_table_logging(table_name, logging):
+    """Switch a destination table between LOGGING and NOLOGGING"""
+    mode = "LOGGING" if logging else "NOLOGGING"
+    try:
+        connection = get_dest_connection()
+        cursor = connection.cursor()
+        cursor.execute(f"ALTER TABLE {DEST_SCHEMA}.{table_name} {mode}")
+        cursor.close()
+        connection.close()
+        print(f"    {DEST_SCHEMA}.{table_name} set to {mode}")
+        return True
+    except Exception as e:
+        print(f"    Warning: Could not set {mode}: {e}")
+        return False
+
+
+def disable_indexes(table_name, truncate=False):
+    """Disable indexes for faster loading, optionally truncating first.
     
-    print(f"    Disabling {len(indexes)} indexes...")
+    Runs as a single PL/SQL block instead of one round trip per statement.
+    """
     disabled = []
     
     try:
         connection = get_dest_connection()
         cursor = connection.cursor()
         
-        for idx_name, uniqueness in indexes:
-            try:
-                cursor.execute(f"ALTER INDEX {DEST_SCHEMA}.{idx_name} UNUSABLE")
-                disabled.append((idx_name, uniqueness))
-            except Exception as e:
-                print(f"      Warning: {idx_name}: {e}")
+        disabled_out = cursor.var(oracledb.DB_TYPE_CURSOR)
+        failed_out = cursor.var(oracledb.DB_TYPE_CURSOR)
+        cursor.execute(DISABLE_INDEXES_PLSQL, do_truncate=1 if truncate else 0,
+                       owner=DEST_SCHEMA.upper(), table_name=table_name.upper(),
+                       disabled_out=disabled_out, failed_out=failed_out)
+        
+        disabled = disabled_out.getvalue().fetchall()
+        failed = [row[0] for row in failed_out.getvalue()]
         
         cursor.close()
         connection.close()
+        
+        if truncate and not any(msg.startswith('TRUNCATE: ') for msg in failed):
+            print(f"    Truncated {DEST_SCHEMA}.{table_name}")
+        if disabled:
+            print(f"    Disabled {len(disabled)} indexes")
+        for msg in failed:
+            print(f"      Warning: {msg}")
     except Exception as e:
         print(f"    Error: {e}")
     
     return disabled
 
 
+def rebuild_index(idx_name):
+    """Rebuild one index on its own connection - returns (idx_name, error)"""
+    try:
+        connection = get_dest_connection()
+        cursor = connection.cursor()
+        nologging = " NOLOGGING" if NOLOGGING_LOAD else ""
+        cursor.execute(f"ALTER INDEX {DEST_SCHEMA}.{idx_name} REBUILD PARALLEL {INDEX_REBUILD_PARALLEL}{nologging}")
+        cursor.close()
+        connection.close()
+        print(f"      Rebuilt: {idx_name}")
+        return idx_name, None
+    except Exception as e:
+        return idx_name, str(e)
+
+
 def rebuild_indexes(table_name, indexes):
-    """Rebuild indexes after loading"""
+    """Rebuild indexes after loading, several at a time.
+    
+    Each rebuild runs on its own connection (the driver releases the GIL
+    while waiting on the database), then all are reset to NOPARALLEL and
+    the LOGGING attribute they had before the load in a single PL/SQL block.
+    Rebuilds skip redo only when NOLOGGING_LOAD is on.
+    """
     if not indexes:
         return
     
-    print(f"    Rebuilding {len(indexes)} indexes...")
+    workers = min(len(indexes), INDEX_REBUILD_WORKERS)
+    print(f"    Rebuilding {len(indexes)} indexes ({workers} at a time)...")
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(rebuild_index, [idx_name for idx_name, _, _ in indexes]))
+    
+    for idx_name, error in results:
+        if error:
+            print(f"      Warning: {idx_name}: {error}")
     
     try:
         connection = get_dest_connection()
         cursor = connection.cursor()
         
-        for idx_name, uniqueness in indexes:
-            try:
-                cursor.execute(f"ALTER INDEX {DEST_SCHEMA}.{idx_name} REBUILD PARALLEL")
-                cursor.execute(f"ALTER INDEX {DEST_SCHEMA}.{idx_name} NOPARALLEL")
-                print(f"      Rebuilt: {idx_name}")
-            except Exception as e:
-                print(f"      Warning: {idx_name}: {e}")
+        name_list_type = connection.gettype("SYS.ODCIVARCHAR2LIST")
+        index_names = name_list_type.newobject([idx_name for idx_name, _, _ in indexes])
+        index_modes = name_list_type.newobject(
+            ["NOLOGGING" if logging == 'NO' else "LOGGING" for _, _, logging in indexes])
+        failed_out = cursor.var(oracledb.DB_TYPE_CURSOR)
+        cursor.execute(RESET_INDEXES_PLSQL, index_names=index_names,
+                       index_modes=index_modes, owner=DEST_SCHEMA.upper(),
+                       failed_out=failed_out)
+        
+        for row in failed_out.getvalue():
+            print(f"      Warning: {row[0]}")
         
         cursor.close()
         connection.close()
@@ -342,7 +834,11 @@ def create_staging_table(table_name, chunk_id):
 
 
 def merge_staging_tables(table_name, staging_tables):
-    """Merge all staging tables into the main table"""
+    """Merge all staging tables into the main table.
+    
+    One direct-path INSERT over a UNION ALL of every staging table and a
+    single commit; falls back to one INSERT/commit per table if that fails.
+    """
     print(f"    Merging {len(staging_tables)} staging tables into {table_name}...")
     
     total_rows = 0
@@ -350,24 +846,38 @@ def merge_staging_tables(table_name, staging_tables):
         connection = get_dest_connection()
         cursor = connection.cursor()
         
-        for stg_table in staging_tables:
-            try:
-                # Get row count
-                cursor.execute(f"SELECT COUNT(*) FROM {DEST_SCHEMA}.{stg_table}")
-                count = cursor.fetchone()[0]
-                
-                # Insert with APPEND hint for direct path
-                cursor.execute(f"""
-                    INSERT /*+ APPEND */ INTO {DEST_SCHEMA}.{table_name}
-                    SELECT * FROM {DEST_SCHEMA}.{stg_table}
-                """)
-                connection.commit()
-                
-                total_rows += count
-                print(f"      Merged {stg_table}: {count:,} rows")
-                
-            except Exception as e:
-                print(f"      Error merging {stg_table}: {e}")
+        union_sql = "\n                    UNION ALL ".join(
+            f"SELECT * FROM {DEST_SCHEMA}.{stg_table}" for stg_table in staging_tables
+        )
+        try:
+            cursor.execute(f"""
+                INSERT /*+ APPEND */ INTO {DEST_SCHEMA}.{table_name}
+                {union_sql}
+            """)
+            total_rows = cursor.rowcount
+            connection.commit()
+            print(f"      Merged {len(staging_tables)} staging tables: {total_rows:,} rows")
+            
+        except Exception as e:
+            print(f"      Batch merge failed ({e}), merging one by one...")
+            connection.rollback()
+            
+            for stg_table in staging_tables:
+                try:
+                    # Insert with APPEND hint for direct path
+                    cursor.execute(f"""
+                        INSERT /*+ APPEND */ INTO {DEST_SCHEMA}.{table_name}
+                        SELECT * FROM {DEST_SCHEMA}.{stg_table}
+                    """)
+                    count = cursor.rowcount
+                    connection.commit()
+                    
+                    total_rows += count
+                    print(f"      Merged {stg_table}: {count:,} rows")
+                    
+                except Exception as e:
+                    print(f"      Error merging {stg_table}: {e}")
+                    connection.rollback()
         
         cursor.close()
         connection.close()
@@ -400,49 +910,89 @@ def drop_staging_tables(staging_tables):
 # =============================================================================
 # STEP 3: LOAD DATA VIA SQL*LOADER
 # =============================================================================
-def count_csv_lines(csv_file):
-    """Count lines in CSV (excluding header)"""
-    count = 0
-    with open(csv_file, 'rb') as f:
-        for _ in f:
-            count += 1
-    return count - 1  # Exclude header
+def find_chunk_bounds(infile, data_start, size, num_chunks):
+    """Byte offsets that cut the data into num_chunks ranges on line boundaries"""
+    chunk_size = max(1, (size - data_start) // num_chunks)
+    bounds = [data_start]
+    
+    for i in range(1, num_chunks):
+        # Seek near the nominal cut, then skip ahead to the next line start
+        infile.seek(data_start + i * chunk_size)
+        infile.readline()
+        pos = infile.tell()
+        if pos >= size:
+            break
+        if pos > bounds[-1]:
+            bounds.append(pos)
+    
+    bounds.append(size)
+    return bounds
+
+
+def copy_byte_range(src, dst, offset, length):
+    """Copy length bytes starting at offset from src to dst"""
+    if sys.platform.startswith('linux'):
+        # Kernel copies the pages directly - no userspace buffer or Python loop
+        while length > 0:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, length)
+            if sent == 0:
+                break
+            offset += sent
+            length -= sent
+        return
+    
+    src.seek(offset)
+    while length > 0:
+        data = src.read(min(COPY_BUFFER_SIZE, length))
+        if not data:
+            break
+        dst.write(data)
+        length -= len(data)
+
+
+def drop_file_cache(path):
+    """Tell the kernel a file's cached pages won't be read again (no-op off Unix)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
 
 
 def split_csv(csv_file, num_chunks, output_dir):
-    """Split CSV into chunks for parallel loading"""
-    total_lines = count_csv_lines(csv_file)
-    lines_per_chunk = (total_lines + num_chunks - 1) // num_chunks
+    """Split CSV into chunks for parallel loading.
     
+    Chunks are cut at roughly equal byte offsets (SQL*Loader throughput
+    doesn't need equal row counts), so the file is read only once.
+    """
+    size = os.path.getsize(csv_file)
     base_name = os.path.splitext(os.path.basename(csv_file))[0]
     chunk_files = []
     
-    with open(csv_file, 'r', encoding='utf-8', buffering=16*1024*1024) as infile:
-        header = next(infile)  # Read header
+    with open(csv_file, 'rb') as infile:
+        if hasattr(os, 'posix_fadvise'):
+            # One front-to-back pass - let the kernel read ahead deeply
+            os.posix_fadvise(infile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         
-        chunk_num = 0
-        current_lines = 0
-        current_file = None
+        header = infile.readline()  # Read header
+        bounds = find_chunk_bounds(infile, infile.tell(), size, num_chunks)
         
-        for line in infile:
-            if current_file is None:
-                chunk_path = os.path.join(output_dir, f"{base_name}_chunk{chunk_num:02d}.csv")
-                current_file = open(chunk_path, 'w', encoding='utf-8', buffering=16*1024*1024)
-                chunk_files.append(chunk_path)
-            
-            current_file.write(line)
-            current_lines += 1
+        for chunk_num, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            chunk_path = os.path.join(output_dir, f"{base_name}_chunk{chunk_num:02d}.csv")
+            with open(chunk_path, 'wb') as outfile:
+                copy_byte_range(infile, outfile, start, end - start)
             
-            if current_lines >= lines_per_chunk:
-                current_file.close()
-                current_file = None
-                current_lines = 0
-                chunk_num += 1
-        
-        if current_file:
-            current_file.close()
+            chunk_files.append(chunk_path)
+    
+    # The full extract is never read again - keep the cache for the chunks
+    drop_file_cache(csv_file)
     
-    return chunk_files, header.strip().split(',')
+    return chunk_files, header.decode('utf-8').strip().split(',')
 
 
 def create_control_file(table_name, csv_file, columns, column_types, output_dir):
@@ -483,15 +1033,8 @@ TRAILING NULLCOLS
     return ctl_file
 
 
-def run_sqlldr(args):
-    """Run SQL*Loader for a chunk"""
-    chunk_file, ctl_file, table_name, chunk_id, output_dir = args
-    
-    # No stagger needed with staging tables - each loads to its own table
-    
-    base = os.path.splitext(os.path.basename(chunk_file))[0]
-    log_file = os.path.join(output_dir, f"{base}.log")
-    
+def build_sqlldr_cmd(ctl_file, log_file):
+    """Build the SQL*Loader command line for one chunk"""
     cmd = [
         'sqlldr',
         f'userid={SQLLDR_CONNECT}',
@@ -508,6 +1051,42 @@ def run_sqlldr(args):
     if DIRECT_PATH:
         cmd.append('direct=true')
     
+    return cmd
+
+
+# Row count line in the summary at the end of a SQL*Loader log
+ROWS_LOADED_RE = re.compile(r'(\d+) Rows? successfully loaded')
+
+
+def read_rows_loaded(log_file):
+    """Parse a SQL*Loader log for the loaded row count.
+    
+    The count is in the summary at the end of the log, so only the last
+    few KB are read however long the log grew (e.g. with rejected rows).
+    """
+    rows_loaded = 0
+    if os.path.exists(log_file):
+        with open(log_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            tail = f.read().decode('utf-8', 'ignore')
+        match = ROWS_LOADED_RE.search(tail)
+        if match:
+            rows_loaded = int(match.group(1))
+    return rows_loaded
+
+
+def run_sqlldr(args):
+    """Run SQL*Loader for a chunk"""
+    chunk_file, ctl_file, table_name, chunk_id, output_dir = args
+    
+    # No stagger needed with staging tables - each loads to its own table
+    
+    base = os.path.splitext(os.path.basename(chunk_file))[0]
+    log_file = os.path.join(output_dir, f"{base}.log")
+    
+    cmd = build_sqlldr_cmd(ctl_file, log_file)
+    
     start_time = datetime.now()
     
     try:
@@ -515,18 +1094,12 @@ def run_sqlldr(args):
         elapsed = (datetime.now() - start_time).total_seconds()
         
         # Parse log for row count
-        rows_loaded = 0
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                import re
-                content = f.read()
-                match = re.search(r'(\d+) Rows? successfully loaded', content)
-                if match:
-                    rows_loaded = int(match.group(1))
+        rows_loaded = read_rows_loaded(log_file)
         
         success = result.returncode in (0, 2)
         
         if success:
+            drop_file_cache(chunk_file)
             speed = rows_loaded / elapsed if elapsed > 0 else 0
             print(f"      [Chunk {chunk_id:02d}] {rows_loaded:,} rows in {elapsed:.1f}s ({speed:,.0f}/s)")
         else:
@@ -542,14 +1115,97 @@ def run_sqlldr(args):
         return False, 0
 
 
-def load_csv_parallel(table_name, csv_file, columns, column_types, work_dir):
-    """Load CSV into destination using parallel SQL*Loader with staging tables"""
-    print(f"\n  Loading {table_name} to destination...")
+def open_pipe_for_writing(pipe_path, reader):
+    """Open a named pipe for writing once the reader process has opened it.
+    
+    A plain blocking open would hang forever if sqlldr died before opening
+    its INFILE, so poll with O_NONBLOCK until the reader shows up.
+    """
+    while True:
+        try:
+            fd = os.open(pipe_path, os.O_WRONLY | os.O_NONBLOCK)
+            break
+        except OSError as e:
+            if e.errno != errno.ENXIO:
+                raise
+            if reader.poll() is not None:
+                raise RuntimeError(f"sqlldr exited with code {reader.returncode} before reading {pipe_path}")
+            time.sleep(0.1)
+    
+    os.set_blocking(fd, True)
+    return open(fd, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+
+
+def stream_chunk(args):
+    """Extract one slice into a named pipe while SQL*Loader loads from the other end"""
+    load_args, extract_args = args
+    pipe_file, ctl_file, table_name, chunk_id, output_dir = load_args
+    select_sql, extract_mode, _, _, num_chunks, row_count_est = extract_args
+    
+    base = os.path.splitext(os.path.basename(pipe_file))[0]
+    log_file = os.path.join(output_dir, f"{base}.log")
+    
+    start_time = datetime.now()
+    proc = subprocess.Popen(build_sqlldr_cmd(ctl_file, log_file),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    try:
+        f = open_pipe_for_writing(pipe_file, proc)
+        try:
+            rows_sent = extract_slice(select_sql, extract_mode, f, chunk_id, num_chunks, row_count_est)
+        except Exception:
+            # Kill the loader before closing the pipe so it doesn't load the
+            # rest of a cut-off stream. Rows it already saved (every
+            # SQLLDR_ROWS) stay in its staging table, which the failed chunk
+            # keeps out of the merge
+            proc.kill()
+            raise
+        finally:
+            f.close()
+        
+        proc.wait(timeout=14400)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        
+        rows_loaded = read_rows_loaded(log_file)
+        success = proc.returncode in (0, 2)
+        
+        if success:
+            speed = rows_loaded / elapsed if elapsed > 0 else 0
+            print(f"      [Chunk {chunk_id:02d}] {rows_loaded:,}/{rows_sent:,} rows streamed in {elapsed:.1f}s ({speed:,.0f}/s)")
+        else:
+            print(f"      [Chunk {chunk_id:02d}] FAILED - check {log_file}")
+        
+        return success, rows_loaded
+        
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        print(f"      [Chunk {chunk_id:02d}] TIMEOUT")
+        return False, 0
+    except Exception as e:
+        proc.kill()
+        print(f"      [Chunk {chunk_id:02d}] ERROR: {e}")
+        return False, 0
+
+
+def extract_and_load_chunk(args):
+    """Extract one slice to its chunk CSV, then load it right away"""
+    load_args, extract_args = args
     
-    # Split CSV into chunks
-    print(f"    Splitting into {PARALLEL_CHUNKS} chunks...")
-    chunk_files, header_cols = split_csv(csv_file, PARALLEL_CHUNKS, work_dir)
-    print(f"    Created {len(chunk_files)} chunks")
+    success, _ = extract_chunk(extract_args)
+    if not success:
+        return False, 0
+    
+    return run_sqlldr(load_args)
+
+
+def load_csv_parallel(table_name, chunk_files, columns, column_types, work_dir, extract_args=None):
+    """Load CSV chunks into destination using parallel SQL*Loader with staging tables.
+    
+    If extract_args is given, each worker first extracts its own slice (into a
+    named pipe or a chunk file, see prepare_chunks) and then loads it, so
+    extract and load overlap instead of running as separate phases.
+    """
+    print(f"\n  Loading {table_name} to destination...")
     
     staging_tables = []
     
@@ -571,7 +1227,7 @@ def load_csv_parallel(table_name, csv_file, columns, column_types, work_dir):
     ctl_files = []
     for i, chunk_file in enumerate(chunk_files):
         target_table = staging_tables[i] if USE_STAGING_TABLES else table_name
-        ctl = create_control_file(target_table, chunk_file, header_cols, column_types, work_dir)
+        ctl = create_control_file(target_table, chunk_file, columns, column_types, work_dir)
         ctl_files.append(ctl)
     
     # Prepare arguments
@@ -580,28 +1236,51 @@ def load_csv_parallel(table_name, csv_file, columns, column_types, work_dir):
         for i in range(len(chunk_files))
     ]
     
-    # Run in parallel (no lock contention with staging tables!)
-    print(f"    Loading {len(chunk_files)} chunks in parallel (staging tables = NO LOCKS)...")
+    # Run in parallel (no lock contention with staging tables!), at most
+    # PARALLEL_CHUNKS sqlldr loaders at a time
     start_time = datetime.now()
+    workers = min(PARALLEL_CHUNKS, len(args_list))
     
-    with Pool(processes=PARALLEL_CHUNKS) as pool:
-        results = pool.map(run_sqlldr, args_list)
+    if extract_args:
+        if use_named_pipes():
+            print(f"    Streaming {len(chunk_files)} chunks through named pipes (extract + load together)...")
+            worker = stream_chunk
+        else:
+            print(f"    Extracting and loading {len(chunk_files)} chunks (each loads as soon as it is extracted)...")
+            worker = extract_and_load_chunk
+        # Spawned, not forked - a fork would copy the parent's session pools
+        # and live Oracle client state into every worker
+        with get_context('spawn').Pool(processes=workers, initializer=init_oracle_client) as pool:
+            results = pool.map(worker, list(zip(args_list, extract_args)), chunksize=1)
+    else:
+        print(f"    Loading {len(chunk_files)} chunks, {workers} at a time (staging tables = NO LOCKS)...")
+        # sqlldr does the work in its own process - threads only wait on it,
+        # so no forked copies of this process (or its sessions). A free
+        # loader takes the next chunk straight away
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_sqlldr, args_list))
     
     load_elapsed = (datetime.now() - start_time).total_seconds()
     
     # Aggregate results
-    total_rows = sum(r[1] for r in results)
     success_count = sum(1 for r in results if r[0])
     
-    # Merge staging tables into main table
-    if USE_STAGING_TABLES and success_count > 0:
-        merge_start = datetime.now()
-        merged_rows = merge_staging_tables(table_name, staging_tables)
-        merge_elapsed = (datetime.now() - merge_start).total_seconds()
-        print(f"    Merge time: {merge_elapsed:.1f}s")
+    if USE_STAGING_TABLES:
+        # A failed chunk can still have saved rows (sqlldr saves every
+        # SQLLDR_ROWS) - only merge the staging tables of chunks that succeeded
+        loaded_tables = [stg for stg, r in zip(staging_tables, results) if r[0]]
+        total_rows = sum(r[1] for r in results if r[0])
+        
+        if loaded_tables:
+            merge_start = datetime.now()
+            merged_rows = merge_staging_tables(table_name, loaded_tables)
+            merge_elapsed = (datetime.now() - merge_start).total_seconds()
+            print(f"    Merge time: {merge_elapsed:.1f}s")
         
-        # Drop staging tables
+        # Drop staging tables (failed chunks' partial rows go with them)
         drop_staging_tables(staging_tables)
+    else:
+        total_rows = sum(r[1] for r in results)
     
     elapsed = (datetime.now() - start_time).total_seconds()
     speed = total_rows / elapsed if elapsed > 0 else 0
@@ -612,6 +1291,204 @@ def load_csv_parallel(table_name, csv_file, columns, column_types, work_dir):
     return success_count == len(chunk_files), total_rows
 
 
+def load_external_table(table_name, chunk_files, columns, column_types, extract_args=None):
+    """Load CSV chunks through an ORACLE_LOADER external table.
+    
+    A single INSERT /*+ APPEND PARALLEL */ reads every chunk inside one
+    session: direct path + parallel DML, and the row count comes straight
+    from cursor.rowcount - no sqlldr processes, control files or logs.
+    """
+    print(f"\n  Loading {table_name} to destination (external table)...")
+    
+    start_time = datetime.now()
+    
+    # Parallel slices are only planned - write them out first
+    if extract_args:
+        print(f"    Extracting {len(extract_args)} chunks...")
+        with get_context('spawn').Pool(processes=len(extract_args), initializer=init_oracle_client) as pool:
+            results = pool.map(extract_chunk, extract_args)
+        if not all(r[0] for r in results):
+            print("    ERROR: Extract failed")
+            return False, 0
+    
+    ext_table = f"{table_name}_EXT"
+    
+    # Every field is read as text; dates are converted in the SELECT
+    col_defs = ',\n            '.join(f"{col} VARCHAR2(4000)" for col in columns)
+    field_defs = ',\n                '.join(f"{col} CHAR(4000)" for col in columns)
+    locations = ', '.join(f"'{os.path.basename(chunk_file)}'" for chunk_file in chunk_files)
+    
+    select_cols = []
+    for col_name in columns:
+        col_type = column_types.get(col_name.upper(), '')
+        
+        if 'TIMESTAMP' in col_type:
+            select_cols.append(f"TO_TIMESTAMP({col_name}, 'YYYY-MM-DD HH24:MI:SS.FF6')")
+        elif col_type == 'DATE':
+            select_cols.append(f"TO_DATE({col_name}, 'YYYY-MM-DD HH24:MI:SS')")
+        else:
+            select_cols.append(col_name)
+    
+    rows_loaded = 0
+    success = False
+    try:
+        connection = get_dest_connection()
+        cursor = connection.cursor()
+        
+        try:
+            cursor.execute(f"DROP TABLE {DEST_SCHEMA}.{ext_table}")
+        except:
+            pass
+        
+        # Session settings changed below - restored before the pooled
+        # session is released, whatever happens
+        cursor.execute("""
+            SELECT value FROM nls_session_parameters
+            WHERE parameter = 'NLS_NUMERIC_CHARACTERS'
+        """)
+        numeric_chars = cursor.fetchone()[0]
+        
+        try:
+            cursor.execute(f"""
+                CREATE TABLE {DEST_SCHEMA}.{ext_table} (
+                {col_defs}
+                )
+                ORGANIZATION EXTERNAL (
+                  TYPE ORACLE_LOADER
+                  DEFAULT DIRECTORY {EXTERNAL_TABLE_DIRECTORY}
+                  ACCESS PARAMETERS (
+                    RECORDS DELIMITED BY NEWLINE
+                    CHARACTERSET AL32UTF8
+                    BADFILE '{table_name}_ext.bad'
+                    LOGFILE '{table_name}_ext.log'
+                    FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+                    MISSING FIELD VALUES ARE NULL
+                    (
+                    {field_defs}
+                    )
+                  )
+                  LOCATION ({locations})
+                )
+                PARALLEL {PARALLEL_CHUNKS}
+                REJECT LIMIT UNLIMITED
+            """)
+            
+            # CSV numbers are written with '.' as the decimal separator
+            cursor.execute("ALTER SESSION SET NLS_NUMERIC_CHARACTERS = '.,'")
+            cursor.execute("ALTER SESSION ENABLE PARALLEL DML")
+            
+            cursor.execute(f"""
+                INSERT /*+ APPEND PARALLEL({PARALLEL_CHUNKS}) */ INTO {DEST_SCHEMA}.{table_name} ({', '.join(columns)})
+                SELECT {', '.join(select_cols)} FROM {DEST_SCHEMA}.{ext_table}
+            """)
+            rows_loaded = cursor.rowcount
+            connection.commit()
+            success = True
+        finally:
+            try:
+                # A failed parallel insert must be rolled back before parallel
+                # DML can be disabled again
+                if not success:
+                    connection.rollback()
+                cursor.execute("ALTER SESSION DISABLE PARALLEL DML")
+                cursor.execute(f"ALTER SESSION SET NLS_NUMERIC_CHARACTERS = '{numeric_chars}'")
+            except Exception as e:
+                print(f"    Warning: Could not reset session: {e}")
+            
+            try:
+                cursor.execute(f"DROP TABLE {DEST_SCHEMA}.{ext_table}")
+            except:
+                pass
+            
+            cursor.close()
+            connection.close()
+        
+    except Exception as e:
+        print(f"    ERROR: {e}")
+    
+    elapsed = (datetime.now() - start_time).total_seconds()
+    speed = rows_loaded / elapsed if elapsed > 0 else 0
+    
+    print(f"    Done: {rows_loaded:,} rows in {format_elapsed(elapsed)} ({speed:,.0f} rows/s)")
+    
+    return success, rows_loaded
+
+
+# =============================================================================
+# SMALL TABLES: DIRECT ARRAY INSERT (NO CSV)
+# =============================================================================
+def number_as_decimal(cursor, metadata):
+    """Output type handler - fetch NUMBER as Decimal so no digits are lost"""
+    if metadata.type_code is oracledb.DB_TYPE_NUMBER:
+        return cursor.var(decimal.Decimal, arraysize=cursor.arraysize)
+
+
+def transfer_table_executemany(table_name, columns, row_count_est, truncate=True):
+    """Copy a small table with fetchmany + executemany - no CSV, no sqlldr.
+    
+    Values are bound as the native Python objects the source returns, so
+    DATE/TIMESTAMP columns need no string formatting round trip. NUMBER is
+    fetched as Decimal to keep every digit. The insert
+    is direct path (APPEND_VALUES), which Oracle doesn't allow in batch error
+    mode - a bad row fails the batch and the table.
+    """
+    print(f"\n  Copying {table_name} with executemany (no CSV)...")
+    
+    table_start = datetime.now()
+    
+    column_names = [col[0] for col in columns]
+    col_list = ', '.join(column_names)
+    binds = ', '.join(f":{i}" for i in range(1, len(column_names) + 1))
+    insert_sql = f"INSERT /*+ APPEND_VALUES */ INTO {DEST_SCHEMA}.{table_name} ({col_list}) VALUES ({binds})"
+    
+    if truncate:
+        truncate_dest_table(table_name)
+    
+    row_count = 0
+    try:
+        src_connection = get_source_connection()
+        dst_connection = get_dest_connection()
+        src_cursor = open_extract_cursor(src_connection)
+        # Default NUMBER fetch is float, which rounds past ~15 significant digits
+        src_cursor.outputtypehandler = number_as_decimal
+        dst_cursor = dst_connection.cursor()
+        
+        src_cursor.execute(f"SELECT {col_list} FROM {SOURCE_SCHEMA}.{table_name}")
+        
+        # Bind buffers are sized once from the source description: strings at
+        # their max length, everything else by type. Otherwise a column whose
+        # first batch is all NULL gets bound as a short VARCHAR and is
+        # reallocated (or rebound) when a later batch has real values.
+        dst_cursor.setinputsizes(*[
+            internal_size if type_code in STRING_DB_TYPES else type_code
+            for _, type_code, _, internal_size, _, _, _ in src_cursor.description
+        ])
+        
+        for rows in iter_batches(src_cursor, "    Copied", row_count_est, INSERT_BATCH_SIZE):
+            dst_cursor.executemany(insert_sql, rows)
+            # APPEND_VALUES is direct path - commit before the next batch
+            dst_connection.commit()
+            row_count += len(rows)
+        
+        src_cursor.close()
+        dst_cursor.close()
+        src_connection.close()
+        dst_connection.close()
+        
+    except Exception as e:
+        # Earlier batches are already committed - the table is incomplete
+        print(f"    ERROR after {row_count:,} rows: {e}")
+        return False, row_count
+    
+    elapsed = (datetime.now() - table_start).total_seconds()
+    speed = row_count / elapsed if elapsed > 0 else 0
+    
+    print(f"\n  TABLE COMPLETE: {table_name}")
+    print(f"  Rows: {row_count:,} | Time: {format_elapsed(elapsed)} ({speed:,.0f} rows/s)")
+    
+    return True, row_count
+
+
 # =============================================================================
 # MAIN TRANSFER FUNCTION
 # =============================================================================
@@ -623,46 +1500,101 @@ def transfer_table(table_name, work_dir, truncate=True):
     
     table_start = datetime.now()
     
-    # Create table-specific work directory
-    table_dir = os.path.join(work_dir, table_name)
-    os.makedirs(table_dir, exist_ok=True)
+    # Row estimate is looked up once and reused by the extract
+    connection = get_source_connection()
+    row_count_est = get_row_count(table_name, connection)
     
-    # Step 1: Extract from source
-    csv_file, row_count, columns = extract_to_csv(table_name, table_dir)
-    if not csv_file or row_count == 0:
+    # Small tables: array insert straight into the destination. LOB locators
+    # can't be bound across connections, so those tables keep the CSV path
+    if DIRECT_INSERT_MAX_ROWS > 0 and 0 < row_count_est < DIRECT_INSERT_MAX_ROWS:
+        columns = get_table_columns(table_name, source_connection_string, SOURCE_SCHEMA)
+        has_lobs = any('LOB' in col[1] or col[1].startswith('LONG') for col in columns)
+        
+        if columns and not has_lobs:
+            # NUM_ROWS may be stale - confirm with a count that stops at the limit
+            row_count_est = count_rows_upto(table_name, connection, DIRECT_INSERT_MAX_ROWS)
+            if 0 < row_count_est < DIRECT_INSERT_MAX_ROWS:
+                connection.close()
+                return transfer_table_executemany(table_name, columns, row_count_est, truncate)
+    
+    connection.close()
+    
+    # Create table-specific work directory (external tables read their
+    # chunks straight from the DIRECTORY path - chunk names carry the table)
+    if use_external_table():
+        table_dir = EXTERNAL_TABLE_PATH
+    else:
+        table_dir = os.path.join(work_dir, table_name)
+        os.makedirs(table_dir, exist_ok=True)
+    
+    # Step 1: Extract from source (slices are only planned here - the load
+    # workers extract them so extract and load overlap). With named pipes a
+    # single stream also goes straight into sqlldr: no CSV is written at all
+    csv_file = None
+    extract_args = None
+    if PARALLEL_EXTRACTS > 1 or use_named_pipes():
+        chunk_files, extract_args, columns = prepare_chunks(table_name, PARALLEL_EXTRACTS, table_dir, row_count_est)
+        row_count = None  # Only known once the overlapped load finishes
+    else:
+        csv_file, row_count, columns = extract_to_csv(table_name, table_dir, row_count_est)
+        chunk_files = None
+        if csv_file and row_count > 0:
+            print(f"    Splitting into {SPLIT_CHUNKS} chunks...")
+            chunk_files, _ = split_csv(csv_file, SPLIT_CHUNKS, table_dir)
+            print(f"    Created {len(chunk_files)} chunks")
+    
+    if not chunk_files or row_count == 0:
         print(f"  FAILED: No data extracted")
         return False, 0
     
     column_types = {col[0]: col[1] for col in columns}
     column_names = [col[0] for col in columns]
     
-    # Step 2: Prepare destination
-    if truncate:
-        truncate_dest_table(table_name)
-    
+    # Step 2: Prepare destination (truncate + disable indexes in one round trip)
     disabled_indexes = []
     if DIRECT_PATH:
-        disabled_indexes = disable_indexes(table_name)
+        disabled_indexes = disable_indexes(table_name, truncate=truncate)
+    elif truncate:
+        truncate_dest_table(table_name)
+    
+    # Direct-path loads/merges into a NOLOGGING table write almost no redo
+    restore_logging = False
+    if DIRECT_PATH and NOLOGGING_LOAD and get_table_logging(table_name) == 'YES':
+        restore_logging = set_table_logging(table_name, False)
     
     # Step 3: Load to destination
-    success, loaded_rows = load_csv_parallel(
-        table_name, csv_file, column_names, column_types, table_dir
-    )
+    if use_external_table():
+        success, loaded_rows = load_external_table(
+            table_name, chunk_files, column_names, column_types, extract_args
+        )
+    else:
+        success, loaded_rows = load_csv_parallel(
+            table_name, chunk_files, column_names, column_types, table_dir, extract_args
+        )
     
     # Step 4: Rebuild indexes
     if disabled_indexes:
         rebuild_indexes(table_name, disabled_indexes)
     
+    if restore_logging:
+        set_table_logging(table_name, True)
+        print(f"    NOTE: Loaded with NOLOGGING - take a backup to make it recoverable")
+    
     # Cleanup
     if success:
-        shutil.rmtree(table_dir)
+        if use_external_table():
+            # Shared directory - only remove this table's files
+            for path in chunk_files + ([csv_file] if csv_file else []):
+                if os.path.exists(path):
+                    os.remove(path)
+        else:
+            shutil.rmtree(table_dir)
         print(f"  Cleaned up temp files")
     
     elapsed = (datetime.now() - table_start).total_seconds()
     print(f"\n  TABLE COMPLETE: {table_name}")
     print(f"  Rows: {loaded_rows:,} | Time: {format_elapsed(elapsed)}")
     
-    gc.collect()
     return success, loaded_rows
 
 
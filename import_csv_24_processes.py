@@ -1,13 +1,12 @@
 import os
 import subprocess
-import glob
 import sys
 import tempfile
 import shutil
 import time
 from datetime import datetime
-from multiprocessing import Pool, cpu_count
-import gc
+from multiprocessing import cpu_count
+from concurrent.futures import ThreadPoolExecutor
 import oracledb
 
 # Database connection details
@@ -23,10 +22,12 @@ DB_CONNECT = f"{DB_USER}/{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_SID}"
 
 # Performance settings (Optimized for 256GB RAM, Xeon Platinum, 10Gbps)
 # Each file ~200MB, ~1.14M rows - load entire file in memory
-PARALLEL_FILES = 32           # Load 32 files at once (32 x 200MB = 6.4GB, fits easily in 256GB)
+# One sqlldr per core (each parses its file on one CPU); override with IMPORT_PARALLEL
+PARALLEL_FILES = int(os.environ.get('IMPORT_PARALLEL', min(cpu_count(), 32)))
 ROWS_PER_COMMIT = 2000000     # Load entire file in one commit (no intermediate commits)
 DIRECT_PATH = True            # Fast direct path - indexes handled separately
 USE_STAGING_TABLES = True     # Use staging tables for lock-free parallel loading
+NOLOGGING_LOAD = True         # Set the table NOLOGGING while loading (minimal redo; take a backup after!)
 SQLLDR_BINDSIZE = 268435456   # 256MB bind buffer (entire file fits)
 SQLLDR_READSIZE = 268435456   # 256MB read buffer
 
@@ -54,7 +55,7 @@ def get_csv_header(csv_file):
 def get_table_columns(table_name):
     """Get column names from database table"""
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         cursor.execute("""
             SELECT column_name, data_type
@@ -83,13 +84,15 @@ DATE_COLUMNS = {
     'START_DATE': 'DATE "YYYY-MM-DD HH24:MI:SS"',
 }
 
-def create_control_file(table_name, csv_file, columns, output_dir):
-    """Create SQL*Loader control file with proper date/timestamp handling"""
+def create_control_file(table_name, csv_file, columns, output_dir, db_columns):
+    """Create SQL*Loader control file with proper date/timestamp handling.
+    
+    db_columns is the (column_name, data_type) list of the target table,
+    looked up once by the caller rather than once per file.
+    """
     base = os.path.splitext(os.path.basename(csv_file))[0]
     ctl_file = os.path.join(output_dir, f"{base}.ctl")
     
-    # Get columns from database with data types
-    db_columns = get_table_columns(table_name)
     db_col_types = {col[0]: col[1] for col in db_columns} if db_columns else {}
     
     # If no columns from CSV header, use database columns
@@ -137,16 +140,26 @@ TRAILING NULLCOLS
     
     return ctl_file
 
+def drop_file_cache(path):
+    """Tell the kernel a file's cached pages won't be read again (no-op off Linux/Unix)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
 def load_single_file(args):
     """Load a single CSV file using SQL*Loader with staging table"""
-    csv_file, file_idx, table_name, temp_dir = args
+    csv_file, file_idx, table_name, temp_dir, db_columns = args
     
     file_name = os.path.basename(csv_file)
     staging_table = None
     
-    # Clear memory before starting
-    gc.collect()
-    
     try:
         # Create staging table for this file
         if USE_STAGING_TABLES:
@@ -162,7 +175,7 @@ def load_single_file(args):
         header_parts = get_csv_header(csv_file)
         
         # Create control file
-        ctl_file = create_control_file(target_table, csv_file, header_parts, temp_dir)
+        ctl_file = create_control_file(target_table, csv_file, header_parts, temp_dir, db_columns)
         
         # Build sqlldr command
         log_file = os.path.join(temp_dir, f"{os.path.splitext(file_name)[0]}.log")
@@ -205,25 +218,22 @@ def load_single_file(args):
         success = result.returncode in (0, 2)
         
         if success:
+            # sqlldr has read the file once and for all - free its page cache
+            drop_file_cache(csv_file)
             speed = rows_loaded / elapsed if elapsed > 0 else 0
             print(f"  [{file_idx:03d}] Done: {file_name} - {rows_loaded:,} rows in {elapsed:.1f}s ({speed:,.0f}/s)")
         else:
             print(f"  [{file_idx:03d}] FAILED: {file_name} - check {log_file}")
         
-        # Clear memory after processing
-        gc.collect()
-        
         return file_idx, success, rows_loaded, csv_file, staging_table
         
     except subprocess.TimeoutExpired:
         print(f"  [{file_idx:03d}] TIMEOUT: {file_name}")
-        gc.collect()
         return file_idx, False, 0, csv_file, staging_table
     except Exception as e:
         print(f"  [{file_idx:03d}] ERROR: {file_name} - {e}")
         import traceback
         traceback.print_exc()
-        gc.collect()
         return file_idx, False, 0, csv_file, staging_table
 
 # Create connection string for oracledb
@@ -244,9 +254,17 @@ def init_oracle_client():
         print("  Check path: D:\\Homeware\\instantclient_23_0")
         sys.exit(1)
 
-def worker_init():
-    """Initialize each worker process - MUST call before any DB connection"""
-    init_oracle_client()
+# Session pool shared by main and the loader threads. Sessions stay open
+# between calls, so helpers and per-file work skip the logon.
+connection_pool = None
+
+def get_connection():
+    """Acquire a pooled connection - close() returns it to the pool"""
+    global connection_pool
+    if connection_pool is None:
+        connection_pool = oracledb.create_pool(dest_connection_string, min=1,
+                                               max=PARALLEL_FILES + 2, increment=1)
+    return connection_pool.acquire()
 
 def truncate_table(table_name):
     """Truncate table using oracledb"""
@@ -254,7 +272,7 @@ def truncate_table(table_name):
     print(f"Truncating {full_table}...")
     
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         cursor.execute(f"TRUNCATE TABLE {full_table}")
         cursor.close()
@@ -268,7 +286,7 @@ def truncate_table(table_name):
 def get_table_indexes(table_name):
     """Get all indexes for a table"""
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         cursor.execute("""
             SELECT index_name, uniqueness 
@@ -310,7 +328,7 @@ def disable_indexes(table_name):
     disabled = []
     
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         for idx_name, uniqueness in nonunique_indexes:
@@ -339,7 +357,7 @@ def rebuild_indexes(table_name, indexes=None):
     print(f"  Rebuilding {len(indexes)} indexes on {table_name}...")
     
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         for idx_info in indexes:
@@ -360,7 +378,7 @@ def create_staging_table(table_name, chunk_id):
     """Create a staging table for a chunk (copy structure, no data, no indexes)"""
     staging_name = f"{table_name}_STG{chunk_id:02d}"
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         # Drop if exists
@@ -390,14 +408,15 @@ def merge_staging_tables(table_name, staging_tables):
     merge_count = 0
     total_rows = 0
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         for stg_table in staging_tables:
             try:
                 # Simple APPEND hint - no PARALLEL to avoid TEMP exhaustion
+                # (redo is skipped via the table's NOLOGGING attribute)
                 cursor.execute(f"""
-                    INSERT /*+ APPEND NOLOGGING */ INTO {SCHEMA}.{table_name}
+                    INSERT /*+ APPEND */ INTO {SCHEMA}.{table_name}
                     SELECT * FROM {SCHEMA}.{stg_table}
                 """)
                 rows_merged = cursor.rowcount
@@ -407,17 +426,12 @@ def merge_staging_tables(table_name, staging_tables):
                 total_rows += rows_merged
                 print(f"    [{merge_count:03d}] Merged {stg_table}: {rows_merged:,} rows")
                 
-                # Clear memory every 10 merges
-                if merge_count % 10 == 0:
-                    gc.collect()
-                
             except Exception as e:
                 print(f"    Error merging {stg_table}: {e}")
                 connection.rollback()  # Rollback failed merge
         
         cursor.close()
         connection.close()
-        gc.collect()
         
     except Exception as e:
         print(f"  Error in merge: {e}")
@@ -429,7 +443,7 @@ def drop_staging_tables(staging_tables):
     """Drop all staging tables"""
     print(f"\n  Dropping {len(staging_tables)} staging tables...")
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         for stg_table in staging_tables:
@@ -443,10 +457,42 @@ def drop_staging_tables(staging_tables):
     except Exception as e:
         print(f"  Error dropping staging tables: {e}")
 
+def get_table_logging(table_name):
+    """Get the LOGGING attribute of a table ('YES', 'NO' or None if unknown)"""
+    try:
+        connection = get_connection()
+        cursor = connection.cursor()
+        cursor.execute("""
+            SELECT logging FROM all_tables 
+            WHERE table_name = :1 AND owner = :2
+        """, [table_name.upper(), SCHEMA.upper()])
+        row = cursor.fetchone()
+        cursor.close()
+        connection.close()
+        return row[0] if row else None
+    except Exception as e:
+        print(f"  Error checking logging: {e}")
+        return None
+
+def set_table_logging(table_name, logging):
+    """Switch a table between LOGGING and NOLOGGING"""
+    mode = "LOGGING" if logging else "NOLOGGING"
+    try:
+        connection = get_connection()
+        cursor = connection.cursor()
+        cursor.execute(f"ALTER TABLE {SCHEMA}.{table_name} {mode}")
+        cursor.close()
+        connection.close()
+        print(f"  {SCHEMA}.{table_name} set to {mode}")
+        return True
+    except Exception as e:
+        print(f"  Warning: Could not set {mode}: {e}")
+        return False
+
 def ensure_indexes_usable(table_name):
     """Ensure all indexes are usable before loading (fix from previous failed runs)"""
     try:
-        connection = oracledb.connect(dest_connection_string)
+        connection = get_connection()
         cursor = connection.cursor()
         
         # Find unusable indexes
@@ -470,6 +516,22 @@ def ensure_indexes_usable(table_name):
     except Exception as e:
         print(f"  Error checking indexes: {e}")
 
+def find_csv_files(csv_dir):
+    """Find CSV files in csv_dir with one scandir pass - returns {path: size}.
+    
+    Matches .csv in any case and skips chunk/staging files from previous runs.
+    """
+    file_sizes = {}
+    with os.scandir(csv_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.lower().endswith('.csv') or not entry.is_file():
+                continue
+            if '_chunk' in name.lower() or '_STG' in name:
+                continue
+            file_sizes[entry.path] = entry.stat().st_size
+    return file_sizes
+
 def main():
     print("="*80)
     print("SQL*LOADER PARALLEL CSV IMPORT")
@@ -490,14 +552,9 @@ def main():
         print(f"ERROR: Directory '{csv_dir}' does not exist!")
         return
     
-    # Find CSV files (use set to avoid duplicates on case-insensitive systems)
-    csv_files = set(glob.glob(os.path.join(csv_dir, "*.csv")) + 
-                    glob.glob(os.path.join(csv_dir, "*.CSV")))
-    
-    # Exclude staging/chunk files from previous runs
-    csv_files = [f for f in csv_files if '_chunk' not in os.path.basename(f).lower() 
-                 and '_STG' not in os.path.basename(f)]
-    csv_files = sorted(csv_files)
+    # Find CSV files in a single directory pass (sizes come with the entries)
+    file_sizes = find_csv_files(csv_dir)
+    csv_files = sorted(file_sizes)
     
     if not csv_files:
         print("No CSV files found!")
@@ -506,14 +563,14 @@ def main():
     print(f"Found {len(csv_files)} CSV files:\n")
     total_size = 0
     for i, f in enumerate(csv_files[:10]):  # Show first 10
-        size_gb = os.path.getsize(f) / (1024 * 1024 * 1024)
+        size_gb = file_sizes[f] / (1024 * 1024 * 1024)
         total_size += size_gb
         print(f"  {i+1:3d}. {os.path.basename(f)} ({size_gb:.2f} GB)")
     
     if len(csv_files) > 10:
         print(f"  ... and {len(csv_files) - 10} more files")
         for f in csv_files[10:]:
-            total_size += os.path.getsize(f) / (1024 * 1024 * 1024)
+            total_size += file_sizes[f] / (1024 * 1024 * 1024)
     
     print(f"\nTotal: {len(csv_files)} files, {total_size:.2f} GB")
     
@@ -541,31 +598,44 @@ def main():
         print("\nDisabling non-unique indexes for faster loading...")
         disabled_indexes = disable_indexes(table_name)
     
+    # Direct-path merge into a NOLOGGING table writes almost no redo.
+    # Set once here (not per worker) and restored after the merge.
+    restore_logging = False
+    if DIRECT_PATH and NOLOGGING_LOAD and get_table_logging(table_name) == 'YES':
+        print("\nSwitching table to NOLOGGING for the load...")
+        restore_logging = set_table_logging(table_name, False)
+    
     # Create temp directory for control files and logs
     temp_dir = tempfile.mkdtemp(prefix=f"sqlldr_{table_name}_")
     print(f"Temp directory: {temp_dir}")
     
     print("\n" + "="*80)
     print(f"LOADING {len(csv_files)} FILES IN PARALLEL")
-    print(f"Parallel processes: {PARALLEL_FILES}")
+    print(f"Parallel loaders: {PARALLEL_FILES}")
     if USE_STAGING_TABLES:
         print("Mode: Staging tables (NO LOCKS)")
     print("="*80)
     
-    # Prepare arguments for parallel loading
+    # Column metadata is the same for every file (staging tables are
+    # copies of the main table) - look it up once
+    db_columns = get_table_columns(table_name)
+    
+    # Prepare arguments for parallel loading - largest files first, so the
+    # tail of the run is made of small files rather than one big straggler
     args_list = [
-        (csv_file, i, table_name, temp_dir)
+        (csv_file, i, table_name, temp_dir, db_columns)
         for i, csv_file in enumerate(csv_files)
     ]
+    args_list.sort(key=lambda args: file_sizes[args[0]], reverse=True)
     
     start_time = datetime.now()
     
-    # Load all files in parallel (worker_init ensures Oracle thick mode in each process)
-    with Pool(processes=min(PARALLEL_FILES, len(csv_files)), initializer=worker_init) as pool:
-        results = pool.map(load_single_file, args_list)
-    
-    # Clear memory after parallel loading
-    gc.collect()
+    # Load all files in parallel. sqlldr does the work in its own process, so
+    # the loaders are threads of this process that only wait on it - no worker
+    # processes, pickling or per-process Oracle client init. Free threads take
+    # the next file in order (largest first).
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_FILES, len(csv_files))) as executor:
+        results = list(executor.map(load_single_file, args_list))
     
     load_elapsed = (datetime.now() - start_time).total_seconds()
     
@@ -602,6 +672,10 @@ def main():
         print("="*80)
         rebuild_indexes(table_name, disabled_indexes)
     
+    if restore_logging:
+        set_table_logging(table_name, True)
+        print("  NOTE: Data loaded with NOLOGGING - take a backup to make it recoverable")
+    
     elapsed = (datetime.now() - start_time).total_seconds()
     
     # Cleanup temp directory
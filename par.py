@@ -8,6 +8,8 @@ Fast Partition-by-Partition Data Extractor
 import os
 import sys
 import csv
+import queue
+import threading
 from datetime import datetime
 from multiprocessing import Pool, cpu_count
 import oracledb
@@ -50,26 +52,52 @@ COLUMNS = [
 # PERFORMANCE SETTINGS (Optimized for 256GB RAM, Xeon Platinum, 10Gbps)
 # =============================================================================
 FETCH_SIZE = 500000           # Rows to fetch at a time (high RAM = bigger batches)
-PARALLEL_EXTRACTS = 32        # Number of partitions to extract in parallel (Xeon = many cores)
+FETCH_AHEAD = 2               # Batches fetched ahead of the CSV writer (each is FETCH_SIZE rows)
+# Number of partitions to extract in parallel. Each runs a PARALLEL(16) query, so the
+# source DB usually saturates before local CPUs do - tune with EXTRACT_PARALLEL
+PARALLEL_EXTRACTS = int(os.environ.get('EXTRACT_PARALLEL', 32))
 WRITE_BUFFER = 64*1024*1024   # 64MB write buffer per file
 OUTPUT_DIR = "."              # Output directory for CSV files
+SDU_SIZE = 2097152            # Session data unit requested (the server caps it at its own DEFAULT_SDU_SIZE)
+USE_THICK_MODE = True         # Thick mode: the source needs native network encryption. Set False to opt into thin mode
 
 # =============================================================================
 # CONNECTION SETUP
 # =============================================================================
-source_dsn = oracledb.makedsn(SOURCE_HOST, SOURCE_PORT, sid=SOURCE_SID)
+# Large SDU so each FETCH_SIZE round trip goes out in fewer network packets
+source_dsn = oracledb.makedsn(SOURCE_HOST, SOURCE_PORT, sid=SOURCE_SID).replace(
+    "(DESCRIPTION=", f"(DESCRIPTION=(SDU={SDU_SIZE})", 1)
 source_connection_string = f"{SOURCE_USER}/{SOURCE_PASSWORD}@{source_dsn}"
 
 def init_oracle_client():
-    """Initialize Oracle client"""
+    """Initialize Oracle client - thick mode unless USE_THICK_MODE is off"""
+    if not USE_THICK_MODE:
+        return
     try:
         oracledb.init_oracle_client()
     except:
         pass
 
+def init_session(connection, requested_tag):
+    """Pool session callback - runs once per new session, not per partition"""
+    cursor = connection.cursor()
+    # Set date formats for consistent output
+    cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
+    cursor.execute("ALTER SESSION SET NLS_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6'")
+    cursor.close()
+
+# One small session pool per process - a worker keeps its session across
+# all the partitions it extracts
+connection_pools = {}
+
 def get_connection():
     """Get a database connection optimized for extraction"""
-    connection = oracledb.connect(source_connection_string)
+    pool = connection_pools.get(os.getpid())
+    if pool is None:
+        pool = oracledb.create_pool(source_connection_string, min=1, max=2, increment=1,
+                                    session_callback=init_session)
+        connection_pools[os.getpid()] = pool
+    connection = pool.acquire()
     cursor = connection.cursor()
     # Optimize for bulk reads
     cursor.arraysize = FETCH_SIZE
@@ -93,24 +121,51 @@ def get_partitions(table_name):
     
     return partitions
 
-def format_value(val, col_idx):
-    """Format a value for CSV output"""
-    if val is None:
-        return ""
-    
-    # REF_DATE (DATE) - index 2
-    if col_idx == 2:
-        if hasattr(val, 'strftime'):
-            return val.strftime('%Y-%m-%d %H:%M:%S')
-        return str(val)
-    
-    # CREATED_DATE, MODIFIED_DATE (TIMESTAMP) - index 13, 14
-    if col_idx in (13, 14):
-        if hasattr(val, 'strftime'):
-            return val.strftime('%Y-%m-%d %H:%M:%S.%f')
-        return str(val)
-    
-    return str(val)
+# Date columns are rendered by Oracle (TO_CHAR in the SELECT) so rows come
+# back ready for csv.writer - no per-row formatting in Python
+DATE_COLUMNS = ("REF_DATE",)
+TIMESTAMP_COLUMNS = ("CREATED_DATE", "MODIFIED_DATE")
+
+def select_list():
+    """SELECT list for the extract - DATE/TIMESTAMP columns formatted server-side"""
+    select_cols = []
+    for col in COLUMNS:
+        if col in DATE_COLUMNS:
+            select_cols.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS') AS {col}")
+        elif col in TIMESTAMP_COLUMNS:
+            select_cols.append(f"TO_CHAR({col}, 'YYYY-MM-DD HH24:MI:SS.FF6') AS {col}")
+        else:
+            select_cols.append(col)
+    return ', '.join(select_cols)
+
+def put_batch(batch_queue, item, stop):
+    """Put on the bounded queue, giving up once the writer has set stop"""
+    while not stop.is_set():
+        try:
+            batch_queue.put(item, timeout=1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+def fetch_batches(cursor, batch_queue, stop):
+    """Fetcher thread - keeps the next batches coming while the writer writes.
+    
+    Puts each fetchmany() batch on the queue, then None at the end (or the
+    exception if the fetch fails). The driver releases the GIL while it waits
+    on the network, so fetching overlaps with writing. Exits early when the
+    writer sets stop (e.g. after a write error).
+    """
+    try:
+        while not stop.is_set():
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            if not put_batch(batch_queue, rows, stop):
+                return
+        put_batch(batch_queue, None, stop)
+    except Exception as e:
+        put_batch(batch_queue, e, stop)
 
 def extract_partition(args):
     """Extract a single partition to CSV"""
@@ -124,49 +179,68 @@ def extract_partition(args):
     row_count = 0
     
     try:
+        # Date formats are set once per session by init_session
         connection, cursor = get_connection()
         
-        # Set date formats for consistent output
-        cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
-        cursor.execute("ALTER SESSION SET NLS_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF6'")
-        
-        # Query partition directly - fastest method with high parallelism
-        sql = f"""
-            SELECT /*+ PARALLEL(t, 16) FULL(t) */
-                {', '.join(COLUMNS)}
-            FROM {SOURCE_SCHEMA}.{table_name} PARTITION ({partition_name}) t
-        """
+        # Fetch on a separate thread; a bounded queue caps memory at a few batches
+        batch_queue = queue.Queue(maxsize=FETCH_AHEAD)
+        stop = threading.Event()
+        fetcher = threading.Thread(target=fetch_batches, args=(cursor, batch_queue, stop), daemon=True)
         
-        cursor.execute(sql)
-        
-        # Write to CSV with large buffer (64MB for 10Gbps network)
-        with open(output_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER) as f:
-            writer = csv.writer(f)
+        try:
+            # Query partition directly - fastest method with high parallelism
+            sql = f"""
+                SELECT /*+ PARALLEL(t, 16) FULL(t) */
+                    {select_list()}
+                FROM {SOURCE_SCHEMA}.{table_name} PARTITION ({partition_name}) t
+            """
             
-            # Write header
-            writer.writerow(COLUMNS)
+            cursor.execute(sql)
+            fetcher.start()
             
-            # Fetch and write in batches
-            while True:
-                rows = cursor.fetchmany(FETCH_SIZE)
-                if not rows:
-                    break
+            # Write to CSV with large buffer (64MB for 10Gbps network)
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+                writer = csv.writer(f)
                 
-                # Format and write rows
-                for row in rows:
-                    formatted_row = [format_value(val, i) for i, val in enumerate(row)]
-                    writer.writerow(formatted_row)
+                # Write header
+                writer.writerow(COLUMNS)
                 
-                row_count += len(rows)
-                
-                # Progress update every 1M rows
-                if row_count % 1000000 == 0:
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    speed = row_count / elapsed if elapsed > 0 else 0
-                    print(f"  [{partition_num:03d}] {partition_name}: {row_count:,} rows ({speed:,.0f}/s)")
-        
-        cursor.close()
-        connection.close()
+                # Write batches as the fetcher delivers them
+                while True:
+                    rows = batch_queue.get()
+                    if rows is None:
+                        break
+                    if isinstance(rows, Exception):
+                        raise rows
+                    
+                    # Rows are already CSV-ready (None is written as "")
+                    writer.writerows(rows)
+                    
+                    row_count += len(rows)
+                    
+                    # Progress update every 1M rows
+                    if row_count % 1000000 == 0:
+                        elapsed = (datetime.now() - start_time).total_seconds()
+                        speed = row_count / elapsed if elapsed > 0 else 0
+                        print(f"  [{partition_num:03d}] {partition_name}: {row_count:,} rows ({speed:,.0f}/s)")
+        except BaseException:
+            # After a write error the fetcher may be blocked on the full queue
+            # (stop releases it) or in a fetch (only a cancel breaks it)
+            stop.set()
+            if fetcher.ident is not None:
+                fetcher.join(timeout=2)
+            if fetcher.is_alive():
+                connection.cancel()
+            raise
+        finally:
+            # On success the fetcher has queued None and is exiting - wait for
+            # it so no break is ever sent to a session going back to the pool
+            if fetcher.ident is not None:
+                fetcher.join()
+            try:
+                cursor.close()
+            finally:
+                connection.close()
         
         elapsed = (datetime.now() - start_time).total_seconds()
         speed = row_count / elapsed if elapsed > 0 else 0
@@ -289,10 +363,12 @@ def main():
         print("Aborted.")
         return
     
-    # Prepare extraction arguments - use original partition index for file naming
+    # Prepare extraction arguments - use original partition index for file naming.
+    # Largest partitions first so a big one doesn't start last and run alone.
+    indexed = sorted(enumerate(selected_partitions), key=lambda p: p[1][1] or 0, reverse=True)
     args_list = [
         (part_name, start_idx + i + 1, TABLE_NAME, OUTPUT_DIR)
-        for i, (part_name, _) in enumerate(selected_partitions)
+        for i, (part_name, _) in indexed
     ]
     
     print("\n" + "="*80)
@@ -303,8 +379,11 @@ def main():
     start_time = datetime.now()
     
     # Extract partitions in parallel
-    with Pool(processes=PARALLEL_EXTRACTS) as pool:
-        results = pool.map(extract_partition, args_list)
+    # Same driver mode in every worker (spawned workers don't inherit it)
+    with Pool(processes=PARALLEL_EXTRACTS, initializer=init_oracle_client) as pool:
+        # One partition per task - a free worker takes the next partition at once
+        # instead of waiting on a pre-assigned chunk of them
+        results = list(pool.imap_unordered(extract_partition, args_list, chunksize=1))
     
     elapsed = (datetime.now() - start_time).total_seconds()
     